@@ -1,6 +1,6 @@
 import os
 import sys
-from sphinx.ext.autodoc.mock import mock
+import ast
 
 sys.path.insert(0, os.path.abspath("."))
 sys.path.insert(0, os.path.abspath(".."))
@@ -34,6 +34,10 @@ intersphinx_mapping = {
     "gobject": ("https://lazka.github.io/pgi-docs/GObject-2.0", None),
     "pygobject": ("https://pygobject.gnome.org", None),
 }
+# Sphinx fetches all inventories concurrently and keeps them in the pickled
+# environment, so incremental builds only hit the network once the cache expires.
+intersphinx_timeout = 5
+intersphinx_cache_limit = 30
 
 templates_path = ["_templates"]
 exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
@@ -54,21 +58,36 @@ always_use_bars_union = True
 
 # =============================== VERSIONING ================================
 
-with mock(autodoc_mock_imports):
-    import ignis
 
-    json_url = f"{DOCS_URL}/_static/switcher.json"
+def _get_ignis_version() -> str:
+    # Read __version__ statically, importing ignis (even mocked) is slow
+    path = os.path.join(os.path.dirname(__file__), "..", "ignis", "__init__.py")
+    with open(path) as file:
+        tree = ast.parse(file.read())
 
-    DOC_TAG = os.getenv("DOC_TAG")
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "__version__"
+        ):
+            return ast.literal_eval(node.value)
 
-    if DOC_TAG == "latest" or DOC_TAG is None:
-        version_match = "dev"
-    elif DOC_TAG == "stable":
-        version_match = "v" + ignis.__version__.replace(".dev0", "")
-    else:
-        version_match = DOC_TAG
+    raise RuntimeError("Couldn't find __version__ in ignis/__init__.py")
 
-    release = version_match
+
+json_url = f"{DOCS_URL}/_static/switcher.json"
+
+DOC_TAG = os.getenv("DOC_TAG")
+
+if DOC_TAG == "latest" or DOC_TAG is None:
+    version_match = "dev"
+elif DOC_TAG == "stable":
+    version_match = "v" + _get_ignis_version().replace(".dev0", "")
+else:
+    version_match = DOC_TAG
+
+release = version_match
 
 # ============================== HTML OPTIONS ===============================
 
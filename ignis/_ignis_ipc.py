@@ -1,3 +1,5 @@
+import os
+from types import CodeType
 from gi.repository import GLib  # type: ignore
 from ignis import utils
 from ignis.dbus import DBusService
@@ -6,6 +8,7 @@ from ignis.exceptions import WindowNotFoundError
 from ignis.command_manager import CommandManager
 from ignis.window_manager import WindowManager
 from typing import TYPE_CHECKING
+from collections.abc import Callable
 
 command_manager = CommandManager.get_default()
 window_manager = WindowManager.get_default()
@@ -13,6 +16,28 @@ window_manager = WindowManager.get_default()
 if TYPE_CHECKING:
     from ignis.app import IgnisApp
 
+_RUN_FILE_CACHE_SIZE = 16
+
+# path -> (mtime, compiled code)
+_run_file_cache: dict[str, tuple[int, CodeType]] = {}
+
+
+def _compile_file(path: str) -> CodeType:
+    mtime = os.stat(path).st_mtime_ns
+
+    cached = _run_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, "rb") as file:
+        code = compile(file.read(), path, "exec")
+
+    if len(_run_file_cache) >= _RUN_FILE_CACHE_SIZE:
+        _run_file_cache.pop(next(iter(_run_file_cache)))
+
+    _run_file_cache[path] = mtime, code
+    return code
+
 
 class IgnisIpc(IgnisGObject):
     def __init__(self, name: str, app: "IgnisApp"):
@@ -27,37 +52,39 @@ class IgnisIpc(IgnisGObject):
             info=utils.load_interface_xml("com.github.linkfrg.ignis"),
         )
 
-        self.__dbus.register_dbus_method(name="OpenWindow", method=self.__OpenWindow)
-        self.__dbus.register_dbus_method(name="CloseWindow", method=self.__CloseWindow)
-        self.__dbus.register_dbus_method(
-            name="ToggleWindow", method=self.__ToggleWindow
-        )
-        self.__dbus.register_dbus_method(name="Quit", method=self.__Quit)
-        self.__dbus.register_dbus_method(name="Inspector", method=self.__Inspector)
-        self.__dbus.register_dbus_method(name="RunPython", method=self.__RunPython)
-        self.__dbus.register_dbus_method(name="RunFile", method=self.__RunFile)
-        self.__dbus.register_dbus_method(name="Reload", method=self.__Reload)
-        self.__dbus.register_dbus_method(name="ListWindows", method=self.__ListWindows)
-        self.__dbus.register_dbus_method(name="RunCommand", method=self.__RunCommand)
-        self.__dbus.register_dbus_method(
-            name="ListCommands", method=self.__ListCommands
+        self.__dbus.register_dbus_methods(
+            {
+                "OpenWindow": self.__OpenWindow,
+                "CloseWindow": self.__CloseWindow,
+                "ToggleWindow": self.__ToggleWindow,
+                "Quit": self.__Quit,
+                "Inspector": self.__Inspector,
+                "RunPython": self.__RunPython,
+                "RunFile": self.__RunFile,
+                "Reload": self.__Reload,
+                "ListWindows": self.__ListWindows,
+                "RunCommand": self.__RunCommand,
+                "ListCommands": self.__ListCommands,
+            }
         )
 
-    def __call_window_method(self, type_: str, window_name: str) -> GLib.Variant:
+    def __call_window_method(
+        self, method: Callable[[str], None], window_name: str
+    ) -> GLib.Variant:
         try:
-            getattr(window_manager, f"{type_}_window")(window_name)
+            method(window_name)
             return GLib.Variant("(b)", (True,))
         except WindowNotFoundError:
             return GLib.Variant("(b)", (False,))
 
     def __OpenWindow(self, invocation, window_name: str) -> GLib.Variant:
-        return self.__call_window_method("open", window_name)
+        return self.__call_window_method(window_manager.open_window, window_name)
 
     def __CloseWindow(self, invocation, window_name: str) -> GLib.Variant:
-        return self.__call_window_method("close", window_name)
+        return self.__call_window_method(window_manager.close_window, window_name)
 
     def __ToggleWindow(self, invocation, window_name: str) -> GLib.Variant:
-        return self.__call_window_method("toggle", window_name)
+        return self.__call_window_method(window_manager.toggle_window, window_name)
 
     def __ListWindows(self, invocation) -> GLib.Variant:
         return GLib.Variant("(as)", (window_manager.list_window_names(),))
@@ -80,9 +107,7 @@ class IgnisIpc(IgnisGObject):
 
     def __RunFile(self, invocation, path: str) -> None:
         invocation.return_value(None)
-        with open(path) as file:
-            code = file.read()
-            exec(code)
+        exec(_compile_file(path))
 
     def __Inspector(self, invocation) -> None:
         utils.open_inspector()
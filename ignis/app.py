@@ -24,6 +24,7 @@ from ignis._deprecation import (
     deprecation_warning,
 )
 from ignis._ignis_ipc import IgnisIpc
+from ignis.options_manager import _flush_autosaves
 
 window_manager = WindowManager.get_default()
 config_manager = ConfigManager.get_default()
@@ -147,6 +148,9 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         """
         Quit Ignis.
         """
+        # reload() replaces the process with os.exec*(), which skips atexit handlers
+        _flush_autosaves()
+
         if ignis._temp_dir:
             logger.debug(f"Removing temp dir: {ignis._temp_dir}")
             try:
@@ -319,7 +323,8 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         Raises:
             StylePathAppliedError: if the given style path is already to the application.
             DisplayNotFoundError
-            CssParsingError: If an error occured while parsing the CSS/SCSS file. NOTE: If you compile a SASS/SCSS file, it will print the wrong section.
+
+        CSS parsing errors don't prevent the style from being applied, they are logged all at once.
 
         .. deprecated:: 0.6
             Use :func:`ignis.css_manager.CssManager.apply_css` instead.
@@ -6,7 +6,7 @@ from ignis._deprecation import ignore_deprecation_warnings
 from ignis.css_manager import (
     CssManager,
     StylePriority,
-    _raise_css_parsing_error,
+    _load_css,
     GTK_STYLE_PRIORITIES,
 )
 
@@ -69,9 +69,8 @@ class BaseWidget(Gtk.Widget, IgnisGObject):
             value = "* {" + value + "}"
 
         css_provider = Gtk.CssProvider()
-        css_provider.connect("parsing-error", _raise_css_parsing_error)
-
-        css_provider.load_from_string(value)
+        # parsing errors are logged, like for CSS applied via CssManager
+        _load_css(f"style of {type(self).__name__}", css_provider, value)
 
         with ignore_deprecation_warnings():
             self.get_style_context().add_provider(
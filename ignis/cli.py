@@ -1,14 +1,19 @@
 import os
 import click
+import functools
 import subprocess
 import collections
-from ignis.client import IgnisClient
-from ignis.exceptions import CommandNotFoundError, WindowNotFoundError
-from typing import Any
-from gi.repository import GLib  # type: ignore
-from ignis import is_editable_install
+from typing import Any, TYPE_CHECKING
 
-DEFAULT_CONFIG_PATH = f"{GLib.get_user_config_dir()}/ignis/config.py"
+if TYPE_CHECKING:
+    from ignis.client import IgnisClient
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_config_path() -> str:
+    from gi.repository import GLib  # type: ignore
+
+    return f"{GLib.get_user_config_dir()}/ignis/config.py"
 
 
 class OrderedGroup(click.Group):
@@ -20,30 +25,55 @@ class OrderedGroup(click.Group):
         return self.commands
 
 
-def _run_git_cmd(args: str) -> str | None:
+def _run_git_cmd(*args: str) -> str | None:
+    repo_dir = os.path.abspath(os.path.join(__file__, "../.."))
     try:
-        repo_dir = os.path.abspath(os.path.join(__file__, "../.."))
-        commit_hash = subprocess.run(
-            f"git -C {repo_dir} {args}",
-            shell=True,
+        result = subprocess.run(
+            ["git", "-C", repo_dir, *args],
             text=True,
             capture_output=True,
-        ).stdout.strip()
+        )
+    except OSError:
+        return None
 
-        return commit_hash
-    except subprocess.CalledProcessError:
+    if result.returncode != 0:
         return None
 
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_git_info() -> tuple[str | None, str | None, str | None]:
+    # query commit hash, ref names and message with a single git call
+    output = _run_git_cmd("log", "-1", "--format=%H%n%D%n%B")
+    if output is None:
+        return None, None, None
 
+    commit, refs, commit_msg = (output.split("\n", 2) + ["", ""])[:3]
+
+    branch = ""
+    for ref in refs.split(", "):
+        if ref.startswith("HEAD -> "):
+            branch = ref.removeprefix("HEAD -> ")
+            break
+
+    return commit, branch, commit_msg.strip()
+
+
+@functools.lru_cache(maxsize=1)
 def get_version_message() -> str:
+    from ignis import is_editable_install
     from ignis._version import __version__  # type: ignore
 
     if not is_editable_install:
         return f"Ignis {__version__}"
     else:
-        commit = _run_git_cmd("rev-parse HEAD")
-        branch = _run_git_cmd("branch --show-current")
-        commit_msg = _run_git_cmd("log -1 --pretty=%B")
+        commit, branch, commit_msg = _get_git_info()
+        if commit is None:
+            return f"""Ignis {__version__}
+Editable install
+"""
+
         return f"""Ignis {__version__}
 Editable install
 Branch: {branch}
@@ -51,6 +81,7 @@ Commit: {commit} ({commit_msg})
 """
 
 
+@functools.lru_cache(maxsize=1)
 def get_systeminfo() -> str:
     current_desktop = os.getenv("XDG_CURRENT_DESKTOP")
     with open("/etc/os-release") as file:
@@ -68,14 +99,26 @@ def print_version(ctx, param, value):
         ctx.exit(print(get_version_message()))
 
 
+@functools.lru_cache(maxsize=1)
+def get_client() -> "IgnisClient":
+    from ignis.client import IgnisClient
+
+    return IgnisClient()
+
+
 def call_client_func(name: str, *args) -> Any:
-    client = IgnisClient()
-    if not client.has_owner:
-        print("Ignis is not running.")
-        exit(1)
+    from ignis.exceptions import (
+        CommandNotFoundError,
+        WindowNotFoundError,
+        IgnisNotRunningError,
+    )
 
+    # IgnisClient checks whether Ignis is running before each call by itself
     try:
-        return getattr(client, name)(*args)
+        return getattr(get_client(), name)(*args)
+    except IgnisNotRunningError:
+        print("Ignis is not running.")
+        exit(1)
     except WindowNotFoundError:
         print(f"No such window: {args[0]}")
         exit(1)
@@ -109,7 +152,7 @@ def cli():
     "--config",
     "-c",
     help="Path to the configuration file (default: ~/.config/ignis/config.py).",
-    default=DEFAULT_CONFIG_PATH,
+    default=get_default_config_path,
     type=str,
     metavar="PATH",
 )
@@ -120,9 +163,7 @@ def init(config: str, debug: bool) -> None:
     from ignis._deprecation import _enable_deprecation_warnings
     from ignis.config_manager import ConfigManager
 
-    client = IgnisClient()
-
-    if client.has_owner:
+    if get_client().has_owner:
         print("Ignis is already running.")
         exit(1)
 
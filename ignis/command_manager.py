@@ -63,6 +63,7 @@ class CommandManager(IgnisGObjectSingleton):
 
     def __init__(self):
         self._commands: dict[str, CommandCallback] = {}
+        self._command_names: tuple[str, ...] | None = None
         super().__init__()
 
     def get_command(self, command_name: str) -> CommandCallback:
@@ -78,11 +79,10 @@ class CommandManager(IgnisGObjectSingleton):
         Raises:
             CommandNotFoundError: If a command with the given name does not exist.
         """
-        command = self._commands.get(command_name, None)
-        if command:
-            return command
-        else:
-            raise CommandNotFoundError(command_name)
+        try:
+            return self._commands[command_name]
+        except KeyError:
+            raise CommandNotFoundError(command_name) from None
 
     def add_command(self, command_name: str, callback: CommandCallback) -> None:
         """
@@ -99,6 +99,7 @@ class CommandManager(IgnisGObjectSingleton):
             raise CommandAddedError(command_name)
 
         self._commands[command_name] = callback
+        self._command_names = None
 
     def command(self, name: str | None = None):
         """
@@ -124,9 +125,12 @@ class CommandManager(IgnisGObjectSingleton):
         Raises:
             CommandNotFoundError: If a command with the given name does not exist.
         """
-        command = self._commands.pop(command_name, None)
-        if not command:
-            raise CommandNotFoundError(command_name)
+        try:
+            del self._commands[command_name]
+        except KeyError:
+            raise CommandNotFoundError(command_name) from None
+
+        self._command_names = None
 
     def run_command(self, command_name: str, *command_args: str) -> str | None:
         """
@@ -141,8 +145,7 @@ class CommandManager(IgnisGObjectSingleton):
             Exception: If the given arguments don't match the command's callback,
                 or if the callback raises an arbitrary Exception.
         """
-        command = self.get_command(command_name)
-        return command(*command_args)
+        return self.get_command(command_name)(*command_args)
 
     def list_command_names(self) -> tuple[str, ...]:
         """
@@ -151,4 +154,7 @@ class CommandManager(IgnisGObjectSingleton):
         Returns:
             A tuple containing command names.
         """
-        return tuple(self._commands.keys())
+        if self._command_names is None:
+            self._command_names = tuple(self._commands)
+
+        return self._command_names
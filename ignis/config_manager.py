@@ -1,5 +1,6 @@
 import os
 import sys
+import importlib.util
 from loguru import logger
 from ignis import utils
 from ignis.gobject import IgnisGObjectSingleton, IgnisProperty, IgnisSignal
@@ -31,6 +32,9 @@ class ConfigManager(IgnisGObjectSingleton):
         self._autoreload_config: bool = True
         self._config_parsed: bool = False
 
+        # editors may emit several events for a single save
+        self._reload_task = utils.DebounceTask(ms=200, target=lambda app: app.reload())
+
     @IgnisSignal
     def config_parsed(self):
         """
@@ -64,7 +68,7 @@ class ConfigManager(IgnisGObjectSingleton):
         if not os.path.isdir(path) and "__pycache__" not in path:
             extension = os.path.splitext(path)[1]
             if extension == ".py" and self.autoreload_config:
-                app.reload()
+                self._reload_task.run(app)
 
     def _load_config(self, app: "IgnisApp", path: str) -> None:
         if not os.path.exists(path):
@@ -81,8 +85,16 @@ class ConfigManager(IgnisGObjectSingleton):
             recursive=True,
         )
 
+        # the config directory must stay importable for the user's own modules
         sys.path.append(config_dir)
-        __import__(config_filename)
+
+        spec = importlib.util.spec_from_file_location(config_filename, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Can't load configuration file: {path}")
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[config_filename] = module
+        spec.loader.exec_module(module)
 
         self._config_parsed = True
         self.emit("config-parsed")
@@ -1,4 +1,5 @@
 import os
+import functools
 from gi.repository import Gtk, GLib  # type: ignore
 from dataclasses import dataclass
 from ignis.gobject import IgnisGObjectSingleton, IgnisProperty, IgnisSignal
@@ -23,12 +24,45 @@ GTK_STYLE_PRIORITIES: dict[StylePriority, int] = {
     "user": Gtk.STYLE_PROVIDER_PRIORITY_USER,
 }
 
+_CSS_SUFFIXES = (".css", ".scss", ".sass")
+_PYCACHE_DIR = f"{os.sep}__pycache__{os.sep}"
 
-def _raise_css_parsing_error(_, section: Gtk.CssSection, gerror: GLib.Error) -> None:
-    raise CssParsingError(section, gerror)
 
+def _get_gtk_priority(priority: StylePriority) -> int:
+    gtk_priority = GTK_STYLE_PRIORITIES.get(priority, None)
 
-@dataclass(kw_only=True)
+    if gtk_priority is None:
+        raise ValueError(f"Invalid style priority: {priority}")
+
+    return gtk_priority
+
+
+def _load_css(name: str, provider: Gtk.CssProvider, css: str | bytes) -> None:
+    # Raising inside the signal handler doesn't propagate out of the GTK call,
+    # PyGObject only prints a traceback per error.
+    # So collect all errors and report them at once after loading.
+    errors: list[CssParsingError] = []
+
+    handler_id = provider.connect(
+        "parsing-error",
+        lambda _, section, gerror: errors.append(CssParsingError(section, gerror)),
+    )
+
+    try:
+        if isinstance(css, bytes):
+            provider.load_from_bytes(GLib.Bytes.new(css))
+        else:
+            provider.load_from_string(css)
+    finally:
+        provider.disconnect(handler_id)
+
+    if errors:
+        logger.error(
+            f'CSS parsing errors in "{name}":\n' + "\n".join(str(e) for e in errors)
+        )
+
+
+@dataclass(kw_only=True, slots=True)
 class CssInfoBase:
     """
     The base class for CSS infos.
@@ -60,8 +94,11 @@ class CssInfoBase:
     def _get_string(self) -> str:
         raise NotImplementedError()
 
+    def _get_css(self) -> str | bytes:
+        return self._get_string()
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True)
 class CssInfoString(CssInfoBase):
     """
     CSS info for a string.
@@ -80,7 +117,7 @@ class CssInfoString(CssInfoBase):
         return self.string
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CssInfoPath(CssInfoBase):
     """
     CSS info for a path.
@@ -108,6 +145,14 @@ class CssInfoPath(CssInfoBase):
         with open(self.path) as f:
             return f.read()
 
+    def _get_css(self) -> str | bytes:
+        if self.compiler_function:
+            return self.compiler_function(self.path)
+
+        # GTK parses UTF-8 bytes anyway, skip decoding to str and encoding back
+        with open(self.path, "rb") as f:
+            return f.read()
+
 
 class CssManager(IgnisGObjectSingleton):
     """
@@ -176,24 +221,56 @@ class CssManager(IgnisGObjectSingleton):
     """
 
     def __init__(self):
+        # name -> (info, provider, loaded CSS, GTK priority the provider is registered with)
         self._css_infos: dict[
-            str, tuple[CssInfoString | CssInfoPath, Gtk.CssProvider]
+            str,
+            tuple[CssInfoString | CssInfoPath, Gtk.CssProvider, str | bytes, int],
         ] = {}
 
-        self._watchers: dict[str, utils.FileMonitor] = {}
+        # (watch path, recursive) -> (file monitor, names of infos using it)
+        self._watchers: dict[tuple[str, bool], tuple[utils.FileMonitor, set[str]]] = {}
+        # name -> key in self._watchers
+        self._watcher_keys: dict[str, tuple[str, bool]] = {}
+        self._pending_reloads: dict[str, utils.Timeout] = {}
 
         self._widgets_style_priority: StylePriority = "application"
 
         super().__init__()
 
-    def __watch_css_files(self, path: str, event_type: str, name: str) -> None:
+    def __watch_css_files(
+        self,
+        file_monitor: utils.FileMonitor,
+        path: str,
+        event_type: str,
+        key: tuple[str, bool],
+    ) -> None:
         if event_type != "changes_done_hint":
             return
 
-        if not os.path.isdir(path) and "__pycache__" not in path:
-            extension = os.path.splitext(path)[1]
-            if extension in (".css", ".scss", ".sass"):
-                self.reload_css(name)
+        # a directory won't have a CSS suffix in practice, so no need to stat the path
+        if not path.endswith(_CSS_SUFFIXES) or _PYCACHE_DIR in path:
+            return
+
+        watcher = self._watchers.get(key, None)
+        if watcher is None:
+            return
+
+        for name in watcher[1]:
+            self.__schedule_reload(name)
+
+    def __schedule_reload(self, name: str) -> None:
+        # editors and VCS tools emit several events per save, reload once
+        self.__cancel_pending_reload(name)
+        self._pending_reloads[name] = utils.Timeout(50, self.__reload_pending, name)
+
+    def __reload_pending(self, name: str) -> None:
+        self._pending_reloads.pop(name, None)
+        self.reload_css(name)
+
+    def __cancel_pending_reload(self, name: str) -> None:
+        timeout = self._pending_reloads.pop(name, None)
+        if timeout:
+            timeout.cancel()
 
     def __start_watching(self, info: CssInfoPath) -> None:
         watch_path: str
@@ -203,22 +280,37 @@ class CssManager(IgnisGObjectSingleton):
         else:
             watch_path = info.path
 
-        self._watchers[info.name] = utils.FileMonitor(
-            path=watch_path,
-            recursive=info.watch_recursively,
-            prevent_gc=False,
-            callback=lambda _, path, event_type, name=info.name: self.__watch_css_files(
-                path, event_type, name
-            ),
-        )
+        # infos in the same directory share a single monitor
+        key = (watch_path, info.watch_recursively)
+        watcher = self._watchers.get(key, None)
+
+        if watcher is None:
+            file_monitor = utils.FileMonitor(
+                path=watch_path,
+                recursive=info.watch_recursively,
+                prevent_gc=False,
+                callback=functools.partial(self.__watch_css_files, key=key),
+            )
+            watcher = file_monitor, set()
+            self._watchers[key] = watcher
+
+        watcher[1].add(info.name)
+        self._watcher_keys[info.name] = key
 
     def __stop_watching(self, name: str) -> None:
-        file_monitor = self._watchers.pop(name, None)
+        self.__cancel_pending_reload(name)
+
+        key = self._watcher_keys.pop(name, None)
 
-        if not file_monitor:
+        if key is None:
             raise CssInfoNotFoundError(name)
 
-        file_monitor.cancel()
+        file_monitor, names = self._watchers[key]
+        names.discard(name)
+
+        if not names:
+            del self._watchers[key]
+            file_monitor.cancel()
 
     @IgnisSignal
     def css_applied(self, info: object):
@@ -297,23 +389,28 @@ class CssManager(IgnisGObjectSingleton):
 
         Raises:
             CssInfoAlreadyAppliedError: If CSS info with the given name is already applied.
-            CssParsingError: If a CSS parsing error occurs, usually due to invalid CSS.
+
+        CSS parsing errors don't prevent the info from being applied, they are logged all at once.
         """
         if info.name in self._css_infos:
             raise CssInfoAlreadyAppliedError(info.name)
 
-        provider = Gtk.CssProvider()
-        provider.connect("parsing-error", _raise_css_parsing_error)
+        self.__apply_css(info, info._get_css())
+
+    def __apply_css(self, info: CssInfoString | CssInfoPath, css: str | bytes) -> None:
+        # resolved here, as the info may be modified by users before being applied
+        gtk_priority = _get_gtk_priority(info.priority)
 
-        provider.load_from_string(info._get_string())
+        provider = Gtk.CssProvider()
+        _load_css(info.name, provider, css)
 
         Gtk.StyleContext.add_provider_for_display(
             utils.get_gdk_display(),
             provider,
-            GTK_STYLE_PRIORITIES[info.priority],
+            gtk_priority,
         )
 
-        self._css_infos[info.name] = info, provider
+        self._css_infos[info.name] = info, provider, css, gtk_priority
 
         if isinstance(info, CssInfoPath) and info.autoreload:
             self.__start_watching(info)
@@ -333,7 +430,7 @@ class CssManager(IgnisGObjectSingleton):
         """
         display = utils.get_gdk_display()
 
-        info, provider = self._css_infos.pop(name, (None, None))
+        info, provider, _, _ = self._css_infos.pop(name, (None, None, None, None))
 
         if info is None or provider is None:
             raise CssInfoNotFoundError(name)
@@ -355,7 +452,7 @@ class CssManager(IgnisGObjectSingleton):
         """
         logger.info("Resetting all CSS infos...")
 
-        for name in self._css_infos.copy().keys():
+        for name in list(self._css_infos):
             self.remove_css(name)
 
         self.emit("css-resetted")
@@ -369,14 +466,33 @@ class CssManager(IgnisGObjectSingleton):
         """
         logger.info(f'Reloading CSS info: "{name}"')
 
-        info, _ = self._css_infos.get(name, (None, None))
+        info, provider, css, applied_priority = self._css_infos.get(
+            name, (None, None, None, None)
+        )
 
-        if not info:
+        if info is None or provider is None or applied_priority is None:
             raise CssInfoNotFoundError(name)
 
-        self.remove_css(name)
-        self.apply_css(info)
+        new_css = info._get_css()
+
+        # the priority might have been changed on the info after applying,
+        # re-register the same provider instead of creating a new one
+        gtk_priority = _get_gtk_priority(info.priority)
+        if gtk_priority != applied_priority:
+            display = utils.get_gdk_display()
+            Gtk.StyleContext.remove_provider_for_display(display, provider)
+            Gtk.StyleContext.add_provider_for_display(display, provider, gtk_priority)
 
+        # skip re-parsing if the resulting CSS is the same
+        if new_css != css:
+            # the provider stays registered on the display, GTK restyles on load
+            _load_css(name, provider, new_css)
+
+        self._css_infos[name] = info, provider, new_css, gtk_priority
+
+        # the info is reloaded in place, but keep the signals of removing and applying it again
+        self.emit("css-removed", info)
+        self.emit("css-applied", info)
         self.emit("css-reloaded", info)
 
     def reload_all_css(self) -> None:
@@ -385,7 +501,7 @@ class CssManager(IgnisGObjectSingleton):
         """
         logger.info("Reloading all CSS infos...")
 
-        for name in self._css_infos.copy().keys():
+        for name in list(self._css_infos):
             self.reload_css(name)
 
         self.emit("all-css-reloaded")
@@ -400,7 +516,7 @@ class CssManager(IgnisGObjectSingleton):
         Returns:
             The CSS info, or ``None`` if the CSS info with the given name is not applied.
         """
-        return self._css_infos.get(name, (None, None))[0]
+        return self._css_infos.get(name, (None, None, None, None))[0]
 
     def list_css_infos(self) -> list[CssInfoString | CssInfoPath]:
         """
@@ -409,7 +525,7 @@ class CssManager(IgnisGObjectSingleton):
         Returns:
             A list of all applied CSS infos.
         """
-        return [info for info, _ in self._css_infos.values()]
+        return [info for info, _, _, _ in self._css_infos.values()]
 
     def list_css_info_names(self) -> list[str]:
         """
@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import itertools
 from gi.repository import Gio, GLib  # type: ignore
 from typing import Any, overload
 from collections.abc import Callable
@@ -6,8 +8,63 @@ from ignis import utils
 from ignis.gobject import IgnisGObject, IgnisProperty
 from ignis.exceptions import DBusMethodNotFoundError, DBusPropertyNotFoundError
 from typing import Literal
+from types import MappingProxyType
+
+BUS_TYPE = MappingProxyType(
+    {"session": Gio.BusType.SESSION, "system": Gio.BusType.SYSTEM}
+)
+
+# method call params smaller than this (in bytes) are unpacked on the main thread
+_INLINE_UNPACK_MAX_SIZE = 4096
+
+# IDs of signal subscriptions made with DBusProxy.signal_subscribe
+_signal_subscription_ids = itertools.count(1)
+
+# proxies to the message bus itself, shared by all DBusProxy.has_owner calls
+_DBUS_DAEMON_PROXIES: dict[str, "DBusProxy"] = {}
+
+
+@functools.lru_cache(maxsize=64)
+def _get_member_names(
+    info: Gio.DBusInterfaceInfo,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    # boxed wrappers hash and compare by the underlying pointer,
+    # so proxies sharing an interface info reuse the names
+    return (
+        tuple(method.name for method in info.methods),
+        tuple(prop.name for prop in info.properties),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _get_member_table(info: Gio.DBusInterfaceInfo) -> dict[str, tuple[str, str]]:
+    # attribute name -> (kind, D-Bus member name), shared by all proxies of an interface;
+    # used to resolve attributes lazily in DBusProxy.__getattr__
+    methods, properties = _get_member_names(info)
+    # inserted in reverse order of precedence: methods, then async variants, then properties
+    table: dict[str, tuple[str, str]] = {}
+    for prop in properties:
+        table[prop] = ("property", prop)
+    for method in methods:
+        table[f"{method}Async"] = ("async", method)
+    for method in methods:
+        table[method] = ("method", method)
+    return table
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_property_variant(interface_name: str, property_name: str) -> GLib.Variant:
+    # parameters for org.freedesktop.DBus.Properties.Get, variants are immutable
+    return GLib.Variant("(ss)", (interface_name, property_name))
+
+
+async def _unpack_async(variant: GLib.Variant) -> Any:
+    # unpacking large replies (e.g., pixbufs) may block the main thread,
+    # small ones are faster to unpack in place than to hand off to a thread
+    if variant.get_size() < _INLINE_UNPACK_MAX_SIZE:
+        return variant.unpack()
 
-BUS_TYPE = {"session": Gio.BusType.SESSION, "system": Gio.BusType.SYSTEM}
+    return await asyncio.to_thread(variant.unpack)
 
 
 class DBusService(IgnisGObject):
@@ -20,6 +77,9 @@ class DBusService(IgnisGObject):
         info: An instance of :class:`Gio.DBusInterfaceInfo`. You can get it from XML using :func:`~ignis.utils.utils.load_interface_xml`.
         on_name_acquired: The function to call when ``name`` is acquired.
         on_name_lost: The function to call when ``name`` is lost.
+        methods: A dictionary of D-Bus methods to register, see :func:`~ignis.dbus.DBusService.register_dbus_methods`.
+        properties: A dictionary of D-Bus properties to register, see :func:`~ignis.dbus.DBusService.register_dbus_properties`.
+        bus_type: The type of the bus.
 
     .. code-block:: python
 
@@ -45,6 +105,9 @@ class DBusService(IgnisGObject):
         info: Gio.DBusInterfaceInfo,
         on_name_acquired: Callable | None = None,
         on_name_lost: Callable | None = None,
+        methods: dict[str, Callable] | None = None,
+        properties: dict[str, Callable] | None = None,
+        bus_type: Literal["session", "system"] = "session",
     ):
         super().__init__()
 
@@ -53,12 +116,16 @@ class DBusService(IgnisGObject):
         self._info = info
         self._on_name_acquired = on_name_acquired
         self._on_name_lost = on_name_lost
+        self._bus_type = bus_type
 
-        self._methods: dict[str, Callable] = {}
-        self._properties: dict[str, Callable] = {}
+        self._methods: dict[str, Callable] = dict(methods) if methods else {}
+        self._properties: dict[str, Callable] = dict(properties) if properties else {}
+
+        self._pending_signals: dict[str, GLib.Variant | None] = {}
+        self._flush_signals_timeout: utils.Timeout | None = None
 
         self._id = Gio.bus_own_name(
-            Gio.BusType.SESSION,
+            BUS_TYPE[bus_type],
             name,
             Gio.BusNameOwnerFlags.NONE,
             self.__export_object,
@@ -89,6 +156,13 @@ class DBusService(IgnisGObject):
         """
         return self._info
 
+    @IgnisProperty
+    def bus_type(self) -> Literal["session", "system"]:
+        """
+        The type of the bus.
+        """
+        return self._bus_type
+
     @IgnisProperty
     def on_name_acquired(self) -> Callable:
         """
@@ -152,21 +226,32 @@ class DBusService(IgnisGObject):
         params: GLib.Variant,
         invocation: Gio.DBusMethodInvocation,
     ) -> None:
-        def callback(func: Callable, unpacked_params) -> None:
-            result = func(invocation, *unpacked_params)
-            invocation.return_value(result)
+        try:
+            func = self._methods[method_name]
+        except KeyError:
+            raise DBusMethodNotFoundError(method_name) from None
 
-        func = self._methods.get(method_name, None)
-        if not func:
-            raise DBusMethodNotFoundError(method_name)
+        # small payloads are cheap to unpack, skip the thread hand-off
+        if params.get_size() < _INLINE_UNPACK_MAX_SIZE:
+            self.__dispatch_method_call(func, invocation, params.unpack())
+            return
 
         # params can contain pixbuf, very large amount of data
         # and unpacking may take some time and block the main thread
         # so we unpack in another thread, and call DBus method when unpacking is finished
         utils.ThreadTask(
-            target=params.unpack, callback=lambda result: callback(func, result)
+            target=params.unpack,
+            callback=functools.partial(self.__dispatch_method_call, func, invocation),
         ).run()
 
+    def __dispatch_method_call(
+        self,
+        func: Callable,
+        invocation: Gio.DBusMethodInvocation,
+        unpacked_params: tuple,
+    ) -> None:
+        invocation.return_value(func(invocation, *unpacked_params))
+
     def __handle_get_property(
         self,
         connection: Gio.DBusConnection,
@@ -175,9 +260,10 @@ class DBusService(IgnisGObject):
         interface: str,
         value: str,
     ) -> GLib.Variant:
-        func = self._properties.get(value, None)
-        if not func:
-            raise DBusPropertyNotFoundError(value)
+        try:
+            func = self._properties[value]
+        except KeyError:
+            raise DBusPropertyNotFoundError(value) from None
 
         return func()
 
@@ -196,6 +282,15 @@ class DBusService(IgnisGObject):
         """
         self._methods[name] = method
 
+    def register_dbus_methods(self, methods: dict[str, Callable]) -> None:
+        """
+        Register multiple D-Bus methods for this service at once.
+
+        Args:
+            methods: A dictionary mapping method names to functions. See :func:`~ignis.dbus.DBusService.register_dbus_method` for requirements.
+        """
+        self._methods.update(methods)
+
     def register_dbus_property(self, name: str, method: Callable) -> None:
         """
         Register D-Bus property for this service.
@@ -209,6 +304,15 @@ class DBusService(IgnisGObject):
         """
         self._properties[name] = method
 
+    def register_dbus_properties(self, properties: dict[str, Callable]) -> None:
+        """
+        Register multiple D-Bus properties for this service at once.
+
+        Args:
+            properties: A dictionary mapping property names to functions. See :func:`~ignis.dbus.DBusService.register_dbus_property` for requirements.
+        """
+        self._properties.update(properties)
+
     def emit_signal(
         self, signal_name: str, parameters: "GLib.Variant | None" = None
     ) -> None:
@@ -228,6 +332,38 @@ class DBusService(IgnisGObject):
             parameters,
         )
 
+    def emit_signal_coalesced(
+        self,
+        signal_name: str,
+        parameters: "GLib.Variant | None" = None,
+        interval_ms: int = 16,
+    ) -> None:
+        """
+        Like :func:`emit_signal`, but coalesce bursts of the same signal.
+
+        The signal is emitted once after ``interval_ms`` with the latest ``parameters``,
+        so use it only for signals which describe a state (e.g., ``NewIcon``), not events.
+
+        Args:
+            signal_name: The name of the signal to emit.
+            parameters: The :class:`GLib.Variant` containing paramaters to pass with the signal.
+            interval_ms: The time in milliseconds to wait for more emissions of the same signal.
+        """
+        self._pending_signals[signal_name] = parameters
+
+        if self._flush_signals_timeout is None:
+            self._flush_signals_timeout = utils.Timeout(
+                ms=interval_ms, target=self.__flush_signals
+            )
+
+    def __flush_signals(self) -> None:
+        self._flush_signals_timeout = None
+        pending = self._pending_signals
+        self._pending_signals = {}
+
+        for signal_name, parameters in pending.items():
+            self.emit_signal(signal_name, parameters)
+
     def unown_name(self) -> None:
         """
         Release ownership of the name.
@@ -281,21 +417,44 @@ class DBusProxy(IgnisGObject):
     Args:
         bus_type: The type of the bus.
         gproxy: An instance of :class:`Gio.DBusProxy`.
+        cache_properties: Whether to read D-Bus properties from the proxy's property cache when possible.
     """
 
-    def __init__(self, bus_type: Literal["session", "system"], gproxy: Gio.DBusProxy):
+    def __init__(
+        self,
+        bus_type: Literal["session", "system"],
+        gproxy: Gio.DBusProxy,
+        cache_properties: bool = False,
+    ):
         super().__init__()
         self._bus_type = bus_type
-        self._methods: list[str] = []
-        self._properties: list[str] = []
-
         self._gproxy = gproxy
+        self._cache_properties = cache_properties
+        self._interface_name_variant = GLib.Variant.new_string(
+            gproxy.props.g_interface_name
+        )
 
-        for method in self.info.methods:
-            self._methods.append(method.name)
+        # bound once, these are used on every call
+        self._call_sync = gproxy.call_sync
+        self._call = gproxy.call
+        # the connection is construct-only, it never changes for a proxy
+        self._connection: Gio.DBusConnection = gproxy.get_connection()
 
-        for prop in self.info.properties:
-            self._properties.append(prop.name)
+        info = self.info
+        methods, properties = _get_member_names(info)
+        self._methods: list[str] = list(methods)
+        self._properties: list[str] = list(properties)
+        self._member_table = _get_member_table(info)
+
+        # for fast lookups in __getattr__ and __setattr__
+        self._properties_set = frozenset(self._properties)
+
+        # signal subscriptions served by the match rule Gio.DBusProxy already has
+        self._signal_callbacks: dict[str, dict[int, Callable | None]] = {}
+        self._signal_ids: dict[int, str] = {}
+        self._g_signal_id: int = 0
+        # subscription ID -> ID of the subscription on the connection
+        self._connection_signal_ids: dict[int, int] = {}
 
     @classmethod
     def new(
@@ -305,6 +464,7 @@ class DBusProxy(IgnisGObject):
         interface_name: str,
         info: Gio.DBusInterfaceInfo,
         bus_type: Literal["session", "system"] = "session",
+        cache_properties: bool = False,
     ) -> "DBusProxy":
         """
         Synchronously initialize a new instance.
@@ -315,6 +475,7 @@ class DBusProxy(IgnisGObject):
             interface_name: A D-Bus interface name.
             info: A :class:`Gio.DBusInterfaceInfo` instance. You can get it from XML using :class:`~ignis.utils.utils.load_interface_xml`.
             bus_type: The type of the bus.
+            cache_properties: Whether to read D-Bus properties from the proxy's property cache when possible.
         """
         gproxy = Gio.DBusProxy.new_for_bus_sync(
             BUS_TYPE[bus_type],
@@ -325,7 +486,7 @@ class DBusProxy(IgnisGObject):
             interface_name,
             None,
         )
-        return cls(bus_type=bus_type, gproxy=gproxy)
+        return cls(bus_type=bus_type, gproxy=gproxy, cache_properties=cache_properties)
 
     @classmethod
     async def new_async(
@@ -335,6 +496,7 @@ class DBusProxy(IgnisGObject):
         interface_name: str,
         info: Gio.DBusInterfaceInfo,
         bus_type: Literal["session", "system"] = "session",
+        cache_properties: bool = False,
     ) -> "DBusProxy":
         """
         Asynchronously initialize a new instance.
@@ -345,6 +507,7 @@ class DBusProxy(IgnisGObject):
             interface_name: A D-Bus interface name.
             info: A :class:`Gio.DBusInterfaceInfo` instance. You can get it from XML using :class:`~ignis.utils.utils.load_interface_xml`.
             bus_type: The type of the bus.
+            cache_properties: Whether to read D-Bus properties from the proxy's property cache when possible.
             callback: A function to call when the initialization is complete. The function will receive a newly initialized instance of this class.
             *user_data: User data to pass to ``callback``.
         """
@@ -358,7 +521,7 @@ class DBusProxy(IgnisGObject):
             interface_name,
         )
 
-        return cls(bus_type=bus_type, gproxy=gproxy)
+        return cls(bus_type=bus_type, gproxy=gproxy, cache_properties=cache_properties)
 
     @IgnisProperty
     def name(self) -> str:
@@ -409,7 +572,7 @@ class DBusProxy(IgnisGObject):
         """
         The instance of :class:`Gio.DBusConnection` for this proxy.
         """
-        return self._gproxy.get_connection()
+        return self._connection
 
     @IgnisProperty
     def methods(self) -> list[str]:
@@ -430,30 +593,35 @@ class DBusProxy(IgnisGObject):
         """
         Whether the ``name`` has an owner.
         """
-        dbus = DBusProxy.new(
-            name="org.freedesktop.DBus",
-            object_path="/org/freedesktop/DBus",
-            interface_name="org.freedesktop.DBus",
-            info=utils.load_interface_xml("org.freedesktop.DBus"),
-            bus_type=self.bus_type,
-        )
+        dbus = _DBUS_DAEMON_PROXIES.get(self.bus_type, None)
+        if dbus is None:
+            dbus = DBusProxy.new(
+                name="org.freedesktop.DBus",
+                object_path="/org/freedesktop/DBus",
+                interface_name="org.freedesktop.DBus",
+                info=utils.load_interface_xml("org.freedesktop.DBus"),
+                bus_type=self.bus_type,
+            )
+            _DBUS_DAEMON_PROXIES[self.bus_type] = dbus
+
         return dbus.NameHasOwner("(s)", self.name)
 
     def __getattr__(self, name: str) -> Any:
-        async def async_method_wrapper(*args, **kwargs):
-            return await self.call_async(name.replace("Async", ""), *args, **kwargs)
-
-        if name in self.methods:
-            return getattr(self._gproxy, name)
-        elif name.endswith("Async") and name.replace("Async", "") in self.methods:
-            return async_method_wrapper
-        elif name in self.properties:
-            return self.get_dbus_property(name)
-        else:
+        # only called for names not found normally, so names defined on the class take precedence
+        member = self.__dict__.get("_member_table", {}).get(name, None)
+        if member is None:
             return super().__getattribute__(name)
 
+        kind, member_name = member
+        if kind == "method":
+            return getattr(self._gproxy, member_name)
+        elif kind == "async":
+            return functools.partial(self.call_async, member_name)
+        else:
+            return self.get_dbus_property(member_name)
+
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in self.__dict__.get("_properties", {}):  # avoid recursion
+        if name in self.__dict__.get("_properties_set", ()):  # avoid recursion
             self.set_dbus_property(name, value)
         else:
             return super().__setattr__(name, value)
@@ -462,34 +630,97 @@ class DBusProxy(IgnisGObject):
         self,
         signal_name: str,
         callback: Callable | None = None,
+        check_signature: bool = True,
     ) -> int:
         """
         Subscribe to D-Bus signal.
 
+        By default, signals are received through the proxy, which already listens to all signals of its interface.
+        The proxy drops signals whose parameters don't match the signature in :attr:`info`.
+        Pass ``check_signature=False`` for signals that may be emitted with a different signature
+        (e.g., by applications not conforming to the interface); they are subscribed on the connection directly.
+
         Args:
             signal_name: The signal name to subscribe.
             callback: A function to call when signal is emitted.
+            check_signature: Whether to drop signals not matching the signature from the interface info.
         Returns:
             A subscription ID that can be used with :func:`~ignis.dbus.DBusProxy.signal_unsubscribe`
         """
-        return self.connection.signal_subscribe(
-            self.name,
-            self.interface_name,
-            signal_name,
-            self.object_path,
-            None,
-            Gio.DBusSignalFlags.NONE,
-            callback,
-        )
+        id_ = next(_signal_subscription_ids)
+
+        if (
+            not check_signature
+            or self._gproxy.get_flags() & Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS
+        ):
+            self._connection_signal_ids[id_] = self._connection.signal_subscribe(
+                self.name,
+                self.interface_name,
+                signal_name,
+                self.object_path,
+                None,
+                Gio.DBusSignalFlags.NONE,
+                callback,
+            )
+            return id_
+
+        # Gio.DBusProxy already listens to all signals of its interface,
+        # dispatch them here instead of adding a match rule per signal
+        if not self._g_signal_id:
+            self._g_signal_id = self._gproxy.connect("g-signal", self.__on_g_signal)
+
+        self._signal_callbacks.setdefault(signal_name, {})[id_] = callback
+        self._signal_ids[id_] = signal_name
+        return id_
 
     def signal_unsubscribe(self, id: int) -> None:
         """
         Unsubscribe from D-Bus signal.
+        Unknown or already unsubscribed IDs are ignored.
 
         Args:
             id: The ID of the subscription.
         """
-        self.connection.signal_unsubscribe(id)
+        connection_id = self._connection_signal_ids.pop(id, None)
+        if connection_id is not None:
+            self._connection.signal_unsubscribe(connection_id)
+            return
+
+        signal_name = self._signal_ids.pop(id, None)
+        if signal_name is None:
+            return
+
+        callbacks = self._signal_callbacks[signal_name]
+        del callbacks[id]
+        if not callbacks:
+            del self._signal_callbacks[signal_name]
+
+        if not self._signal_ids:
+            self._gproxy.disconnect(self._g_signal_id)
+            self._g_signal_id = 0
+
+    def __on_g_signal(
+        self,
+        gproxy: Gio.DBusProxy,
+        sender_name: str,
+        signal_name: str,
+        parameters: GLib.Variant,
+    ) -> None:
+        callbacks = self._signal_callbacks.get(signal_name, None)
+        if not callbacks:
+            return
+
+        # copy, a callback may unsubscribe
+        for callback in tuple(callbacks.values()):
+            if callback:
+                callback(
+                    self._connection,
+                    sender_name,
+                    self.object_path,
+                    self.interface_name,
+                    signal_name,
+                    parameters,
+                )
 
     def __get_variant(self, signature: str, *args) -> GLib.Variant:
         if "(" in signature:
@@ -517,7 +748,7 @@ class DBusProxy(IgnisGObject):
         Returns:
             The returned data from the D-Bus method.
         """
-        variant = self._gproxy.call_sync(
+        variant = self._call_sync(
             method_name=method_name,
             parameters=self.__get_variant(signature, *args) if signature else None,
             flags=flags,
@@ -546,14 +777,30 @@ class DBusProxy(IgnisGObject):
         Returns:
             The returned data from the D-Bus method.
         """
-        variant = await self._gproxy.call(  # type: ignore
+        variant = await self._call(  # type: ignore
             method_name=method_name,
             parameters=self.__get_variant(signature, *args) if signature else None,
             flags=flags,
             timeout_msec=timeout,
         )
 
-        return await asyncio.to_thread(lambda: variant.unpack())
+        return await _unpack_async(variant)
+
+    def __get_cached_property(self, property_name: str, unpack: bool) -> Any:
+        if not self._cache_properties:
+            return None
+
+        # Gio.DBusProxy loads all properties on creation and keeps them
+        # up to date using PropertiesChanged, invalidated ones are None
+        variant = self._gproxy.get_cached_property(property_name)
+        if variant is None:
+            return None
+
+        if unpack:
+            return variant.unpack()
+        else:
+            # the same shape as the reply of org.freedesktop.DBus.Properties.Get
+            return GLib.Variant("(v)", (variant,))
 
     @overload
     def get_dbus_property(
@@ -577,16 +824,17 @@ class DBusProxy(IgnisGObject):
         Returns:
             The value of the D-Bus property or :class:`GLib.Variant`.
         """
+        cached = self.__get_cached_property(property_name, unpack)
+        if cached is not None:
+            return cached
+
         try:
-            variant = self.connection.call_sync(
+            variant = self._connection.call_sync(
                 self.name,
                 self.object_path,
                 "org.freedesktop.DBus.Properties",
                 "Get",
-                GLib.Variant(
-                    "(ss)",
-                    (self.interface_name, property_name),
-                ),
+                _get_property_variant(self.interface_name, property_name),
                 None,
                 Gio.DBusCallFlags.NONE,
                 -1,
@@ -623,27 +871,81 @@ class DBusProxy(IgnisGObject):
         Returns:
             The value of the D-Bus property or :class:`GLib.Variant`.
         """
+        cached = self.__get_cached_property(property_name, unpack)
+        if cached is not None:
+            return cached
 
-        variant = await self.connection.call(
+        variant = await self._connection.call(
             self.name,
             self.object_path,
             "org.freedesktop.DBus.Properties",
             "Get",
-            GLib.Variant(
-                "(ss)",
-                (self.interface_name, property_name),
-            ),
+            _get_property_variant(self.interface_name, property_name),
             None,
             Gio.DBusCallFlags.NONE,
             -1,
         )
 
         if unpack:
-            # unpack in thread
-            return await asyncio.to_thread(lambda: variant[0])
+            return (await _unpack_async(variant))[0]
         else:
             return variant
 
+    def get_all_dbus_properties(self) -> dict[str, Any]:
+        """
+        Get the values of all D-Bus properties of the interface in a single call.
+
+        Returns:
+            A dictionary mapping property names to their unpacked values.
+        """
+        try:
+            variant = self._connection.call_sync(
+                self.name,
+                self.object_path,
+                "org.freedesktop.DBus.Properties",
+                "GetAll",
+                GLib.Variant.new_tuple(self._interface_name_variant),
+                None,
+                Gio.DBusCallFlags.NONE,
+                -1,
+                None,
+            )
+            return variant[0]
+
+        except GLib.Error:
+            return {}
+
+    async def get_all_dbus_properties_async(self) -> dict[str, Any]:
+        """
+        Asynchronously get the values of all D-Bus properties of the interface in a single call.
+
+        Returns:
+            A dictionary mapping property names to their unpacked values.
+        """
+        variant = await self._connection.call(
+            self.name,
+            self.object_path,
+            "org.freedesktop.DBus.Properties",
+            "GetAll",
+            GLib.Variant.new_tuple(self._interface_name_variant),
+            None,
+            Gio.DBusCallFlags.NONE,
+            -1,
+        )
+
+        return (await _unpack_async(variant))[0]
+
+    def __get_set_property_variant(
+        self, property_name: str, value: GLib.Variant
+    ) -> GLib.Variant:
+        # parameters for org.freedesktop.DBus.Properties.Set,
+        # built from primitives to avoid parsing the "(ssv)" signature
+        return GLib.Variant.new_tuple(
+            self._interface_name_variant,
+            GLib.Variant.new_string(property_name),
+            GLib.Variant.new_variant(value),
+        )
+
     def set_dbus_property(self, property_name: str, value: GLib.Variant) -> None:
         """
         Set a D-Bus property's value.
@@ -652,15 +954,12 @@ class DBusProxy(IgnisGObject):
             property_name: The name of the property to set.
             value: The new value for the property.
         """
-        self.connection.call_sync(
+        self._connection.call_sync(
             self.name,
             self.object_path,
             "org.freedesktop.DBus.Properties",
             "Set",
-            GLib.Variant(
-                "(ssv)",
-                (self.interface_name, property_name, value),
-            ),
+            self.__get_set_property_variant(property_name, value),
             None,
             Gio.DBusCallFlags.NONE,
             -1,
@@ -678,15 +977,12 @@ class DBusProxy(IgnisGObject):
             value: The new value for the property.
         """
 
-        await self.connection.call(
+        await self._connection.call(
             self.name,
             self.object_path,
             "org.freedesktop.DBus.Properties",
             "Set",
-            GLib.Variant(
-                "(ssv)",
-                (self.interface_name, property_name, value),
-            ),
+            self.__get_set_property_variant(property_name, value),
             None,
             Gio.DBusCallFlags.NONE,
             -1,
@@ -49,9 +49,11 @@ class DBusMenuItem(IgnisMenuItem):
         super().__init__(
             label=label,
             enabled=enabled,
-            on_activate=lambda *_: asyncio.create_task(weak_self().__on_activate())  # type: ignore
-            if weak_self()
-            else None,
+            on_activate=lambda *_: (
+                asyncio.create_task(weak_self().__on_activate())  # type: ignore
+                if weak_self()
+                else None
+            ),
         )
 
     async def __on_activate(self) -> None:
@@ -80,12 +82,17 @@ class DBusMenu(Gtk.PopoverMenu):
         self._menu_id: int = 0
         self._model: IgnisMenuModel | None = None
 
+        # some applications emit these with a signature different from the spec,
+        # the menu only needs to know that something changed
         self.__proxy.signal_subscribe(
-            "LayoutUpdated", lambda *args: asyncio.create_task(self.__sync())
+            "LayoutUpdated",
+            lambda *args: asyncio.create_task(self.__sync()),
+            check_signature=False,
         )
         self.__proxy.signal_subscribe(
             "ItemsPropertiesUpdated",
             lambda *args: asyncio.create_task(self.__sync()),
+            check_signature=False,
         )
 
     @classmethod
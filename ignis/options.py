@@ -1,4 +1,5 @@
 import os
+import shutil
 from ignis import DATA_DIR, CACHE_DIR, is_sphinx_build
 from gi.repository import GLib  # type: ignore
 from ignis.options_manager import OptionsManager, OptionsGroup, TrackedList
@@ -26,11 +27,8 @@ def _migrate_old_options_file() -> None:
         f"Migrating options to the new file: {OLD_OPTIONS_FILE} -> {OPTIONS_FILE}"
     )
 
-    with open(OLD_OPTIONS_FILE) as f:
-        data = f.read()
-
-    with open(OPTIONS_FILE, "w") as f:
-        f.write(data)
+    # the old file is kept, copyfile() copies in the kernel where possible
+    shutil.copyfile(OLD_OPTIONS_FILE, OPTIONS_FILE)
 
     logger.success(
         f"Done. Consider using new options file instead: $XDG_DATA_HOME/ignis/options.json ({OPTIONS_FILE}). The old one is deprecated. See the Breaking Changes Tracker for more info."
@@ -1,4 +1,9 @@
+import os
 import json
+import stat
+import atexit
+import weakref
+import tempfile
 from ignis.gobject import IgnisGObject, Binding, IgnisProperty, IgnisSignal
 from ignis import utils
 from typing import Any, TypeVar
@@ -8,6 +13,25 @@ from ignis import is_sphinx_build
 
 T = TypeVar("T")
 
+# delay in milliseconds before changed options are written to the file
+_AUTOSAVE_DELAY = 100
+
+# managers which save to a file, to flush pending autosaves when the app quits or reloads
+_file_managers: "weakref.WeakSet[OptionsManager]" = weakref.WeakSet()
+
+
+def _flush_autosaves() -> None:
+    """
+    Write pending autosaves of all options managers to their files immediately.
+
+    :meta private:
+    """
+    for manager in list(_file_managers):
+        manager._flush_autosave()
+
+
+atexit.register(_flush_autosaves)
+
 
 class TrackedList(list[T]):
     """
@@ -350,9 +374,14 @@ class OptionsManager(OptionsGroup):
     def __init__(self, file: str | None = None, hot_reload: bool = True):
         super().__init__()
         self._file = file
+        self._autosave_timeout: utils.Timeout | None = None
+        # the last known contents of the file, to skip reloading unchanged data
+        self._file_contents: bytes | None = None
 
         if not is_sphinx_build and self._file is not None:
             self.connect("autosave", self.__autosave)
+            # flushed at exit; os.exec*() on reload skips atexit, IgnisApp flushes explicitly
+            _file_managers.add(self)
 
             self.load_from_file(self._file, emit=False)
 
@@ -366,23 +395,73 @@ class OptionsManager(OptionsGroup):
         if event_type != "changes_done_hint":
             return
 
-        with open(self._file) as fp:
-            data = json.load(fp)
+        with open(self._file, "rb") as fp:
+            contents = fp.read()
 
-        self.apply_from_dict(data, autosave=False)
+        # e.g., our own save or a touch without modifications
+        if contents == self._file_contents:
+            return
+
+        self._file_contents = contents
+        self.apply_from_dict(json.loads(contents), autosave=False)
 
     def __autosave(self, *args) -> None:
+        # coalesce bursts of changes into a single write
+        if self._autosave_timeout is None:
+            self._autosave_timeout = utils.Timeout(
+                ms=_AUTOSAVE_DELAY, target=self._flush_autosave
+            )
+
+    def _flush_autosave(self) -> None:
+        """
+        :meta private:
+        """
+        if self._autosave_timeout is None:
+            return
+
+        self._autosave_timeout.cancel()
+        self._autosave_timeout = None
         self.save_to_file(self._file)  # type: ignore
 
     def save_to_file(self, file: str) -> None:
         """
         Manually save options to the specified file.
 
+        The file is replaced atomically, so it is never left partially written.
+        If ``file`` is a symlink, its target is replaced and the symlink is kept.
+
         Args:
             file: The path to the file where options will be saved.
         """
-        with open(file, "w") as fp:
-            json.dump(self.get_modified_options(), fp, indent=4)
+        contents = json.dumps(self.get_modified_options(), indent=4).encode()
+
+        # replace the target, replacing a symlink itself would turn it into a regular file
+        target = os.path.realpath(file)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                # mkstemp() creates the file with 0600, keep the permissions of the existing file
+                os.fchmod(fp.fileno(), self.__get_file_mode(target))
+                fp.write(contents)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if file == self._file:
+            self._file_contents = contents
+
+    def __get_file_mode(self, path: str) -> int:
+        try:
+            return stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            # the mode open() would create a new file with
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
 
     def load_from_file(self, file: str, emit: bool = True) -> None:
         """
@@ -392,6 +471,10 @@ class OptionsManager(OptionsGroup):
             file: The path to the file from which options will be loaded.
             emit: Whether to emit the :attr:`changed `and :attr:`subgroup_changed` signals for options in `file` that differ from those on `self`.
         """
-        with open(file) as fp:
-            data = json.load(fp)
-            self.apply_from_dict(data=data, emit=emit, autosave=False)
+        with open(file, "rb") as fp:
+            contents = fp.read()
+
+        if file == self._file:
+            self._file_contents = contents
+
+        self.apply_from_dict(data=json.loads(contents), emit=emit, autosave=False)
@@ -1,11 +1,17 @@
 import json
 import os
 import socket
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from gi.repository import GLib  # type: ignore
 from typing import Any, Literal
 from ignis import utils
 from ignis.exceptions import HyprlandIPCNotFoundError
 from ignis.base_service import BaseService
 from ignis.gobject import IgnisProperty, IgnisSignal
+from loguru import logger
 from collections.abc import Callable
 from dataclasses import dataclass
 from .constants import HYPR_SOCKET_DIR
@@ -28,6 +34,8 @@ class _HyprlandObjDesc:
 
 _SupportedTypes = Literal["workspace", "window", "monitor"]
 
+_IPC_SOCKET_PATH = f"{HYPR_SOCKET_DIR}/.socket.sock"
+
 
 class HyprlandService(BaseService):
     """
@@ -64,6 +72,26 @@ class HyprlandService(BaseService):
         self._active_window: HyprlandWindow = HyprlandWindow()
         self._monitors: dict[str, HyprlandMonitor] = {}
 
+        # the last raw IPC replies, to skip resyncs which wouldn't change anything
+        self._active_workspace_reply: str | None = None
+        self._active_window_reply: str | None = None
+
+        # resyncs requested by events, flushed once per main loop iteration
+        self._pending_syncs: set[str] = set()
+        self._sync_scheduled = False
+
+        # a single thread for IPC requests made while handling events
+        self._ipc_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hyprland-ipc"
+        )
+
+        self._events_socket: socket.socket | None = None
+        self._events_buffer = b""
+
+        # received events, handled in order; handling pauses while one waits for IPC in a thread
+        self._event_queue: deque[Callable[[], None]] = deque()
+        self._event_fetching = False
+
         self._OBJ_TYPES: dict[str, _HyprlandObjDesc] = {
             "workspace": _HyprlandObjDesc(
                 cmd="j/workspaces",
@@ -178,19 +206,78 @@ class HyprlandService(BaseService):
         """
         return list(self._monitors.values())
 
-    @utils.run_in_thread
     def __listen_events(self) -> None:
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
-            sock.connect(f"{HYPR_SOCKET_DIR}/.socket2.sock")
-            for event in utils.listen_socket(sock, errors="ignore"):
-                self.__on_event_received(event)
+        # watch the socket from the main loop instead of blocking a dedicated thread on it
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(f"{HYPR_SOCKET_DIR}/.socket2.sock")
+        sock.setblocking(False)
+        self._events_socket = sock
+
+        GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            sock.fileno(),
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self.__on_events_ready,
+        )
+
+    def __on_events_ready(self, fd: int, condition: GLib.IOCondition) -> bool:
+        sock = self._events_socket
+        if sock is None:
+            return GLib.SOURCE_REMOVE
+
+        data = bytearray()
+        closed = False
+        try:
+            # drain everything available, events come in bursts
+            while chunk := sock.recv(65536):
+                data.extend(chunk)
+            closed = True
+        except BlockingIOError:
+            pass
+        except OSError:
+            closed = True
+
+        *events, self._events_buffer = (self._events_buffer + data).split(b"\n")
+        for event in events:
+            self._event_queue.append(
+                functools.partial(
+                    self.__on_event_received, event.decode("utf-8", errors="ignore")
+                )
+            )
+        self.__handle_queued_events()
+
+        if closed:
+            sock.close()
+            self._events_socket = None
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+    def __handle_queued_events(self) -> None:
+        while self._event_queue and not self._event_fetching:
+            self._event_queue.popleft()()
+
+    def __fetch_then_apply(
+        self, fetch: Callable[[], Any], apply: Callable[[Any], None]
+    ) -> None:
+        # handlers run on the main loop, so IPC goes to the IPC thread;
+        # later events wait for the result to keep them in order (e.g., openwindow -> closewindow)
+        def done(data: Any | None) -> None:
+            try:
+                if data is not None:
+                    apply(data)
+            finally:
+                self._event_fetching = False
+                self.__handle_queued_events()
+
+        self._event_fetching = True
+        self.__run_ipc(fetch, done)
 
     def __on_event_received(self, event: str) -> None:
         def get_full_w_addr(addr: str) -> str:
             return "0x" + addr
 
-        event_data = event.split(">>", 1)
-        event_type, event_value = event_data
+        event_type, _, event_value = event.partition(">>")
         value_list = event_value.split(",")
 
         match event_type:
@@ -199,14 +286,14 @@ class HyprlandService(BaseService):
             case "createworkspacev2":
                 self.__create_workspace(int(value_list[0]))
             case "workspace":
-                self.__sync_active_workspace()
-                self.__sync_monitor_active_ws()
+                self.__schedule_sync("active-workspace")
+                self.__schedule_sync("monitor-active-workspace")
             case "focusedmon":
-                self.__sync_active_workspace()
+                self.__schedule_sync("active-workspace")
             case "activelayout":
                 self.__sync_active_layout(value_list[1])
             case "activewindow":
-                self.__sync_active_window()
+                self.__schedule_sync("active-window")
             case "renameworkspace":
                 self.__rename_workspace(int(value_list[0]), value_list[1])
             case "openwindow":
@@ -247,10 +334,73 @@ class HyprlandService(BaseService):
             case "moveworkspacev2":
                 self.__move_workspace(int(value_list[0]), value_list[2])
             case "togglegroup":
-                self.__toggle_window_group(int(value_list[0]), value_list[1].split(","))
-                self.__sync_active_window()
+                self.__toggle_window_group(
+                    int(value_list[0]), [get_full_w_addr(i) for i in value_list[1:]]
+                )
+                self.__schedule_sync("active-window")
             case "fullscreen":
-                self.__sync_active_window()
+                self.__schedule_sync("active-window")
+
+    def __schedule_sync(self, name: str) -> None:
+        # Hyprland sends events in bursts (e.g., on workspace switch),
+        # each resync is an IPC round trip, so do it once per burst
+        self._pending_syncs.add(name)
+        if not self._sync_scheduled:
+            self._sync_scheduled = True
+            GLib.idle_add(self.__flush_pending_syncs)
+
+    def __flush_pending_syncs(self) -> bool:
+        pending = self._pending_syncs
+        self._pending_syncs = set()
+
+        # only one flush runs at a time, syncs requested meanwhile are flushed right after it
+        self.__run_ipc(
+            lambda: self.__fetch_pending_syncs(pending), self.__apply_pending_syncs
+        )
+
+        return GLib.SOURCE_REMOVE
+
+    def __run_ipc(
+        self, fetch: Callable[[], Any], done: Callable[[Any | None], None]
+    ) -> None:
+        # IPC and JSON parsing happen in the IPC thread, done() is always called
+        # back on the main loop: with the result, or with None if fetch() failed
+        def run() -> None:
+            try:
+                result = fetch()
+            except Exception:
+                logger.exception("Hyprland IPC request failed")
+                result = None
+
+            GLib.idle_add(lambda: done(result) or GLib.SOURCE_REMOVE)
+
+        self._ipc_executor.submit(run)
+
+    def __fetch_pending_syncs(self, pending: set[str]) -> dict[str, Any]:
+        results: dict[str, Any] = dict.fromkeys(pending)
+
+        if "active-workspace" in pending:
+            results["active-workspace"] = self.__fetch_active_workspace()
+        if "active-window" in pending:
+            results["active-window"] = self.__fetch_active_window()
+
+        return results
+
+    def __apply_pending_syncs(self, results: dict[str, Any] | None) -> None:
+        try:
+            if results is not None:
+                if "active-workspace" in results:
+                    self.__apply_active_workspace(results["active-workspace"])
+                if "monitor-active-workspace" in results:
+                    self.__sync_monitor_active_ws()
+                if "active-window" in results:
+                    self.__apply_active_window(results["active-window"])
+        finally:
+            # never leave syncs stuck as scheduled, they'd stop for the rest of the session
+            self._sync_scheduled = False
+            if self._pending_syncs:
+                self._sync_scheduled = True
+                GLib.idle_add(self.__flush_pending_syncs)
 
     def __get_self_dict(self, obj_desc: _HyprlandObjDesc) -> dict:
         return getattr(self, f"_{obj_desc.prop_name}")
@@ -280,9 +430,13 @@ class HyprlandService(BaseService):
         return {}
 
     def __add_obj(self, type_: _SupportedTypes, key: Any) -> None:
-        obj_desc = self._OBJ_TYPES[type_]
+        self.__fetch_then_apply(
+            lambda: self.__get_obj_data(type_=type_, key=key),
+            lambda data: self.__apply_added_obj(type_, data),
+        )
 
-        data = self.__get_obj_data(type_=type_, key=key)
+    def __apply_added_obj(self, type_: _SupportedTypes, data: dict) -> None:
+        obj_desc = self._OBJ_TYPES[type_]
 
         if data == {}:
             return
@@ -338,10 +492,24 @@ class HyprlandService(BaseService):
             )
 
     def __sort_workspaces(self) -> None:
-        self._workspaces = dict(sorted(self._workspaces.items()))
+        # sort by ID only, comparing whole (id, workspace) tuples is slower
+        self._workspaces = dict(sorted(self._workspaces.items(), key=itemgetter(0)))
 
     def __sync_active_workspace(self) -> None:
-        workspace_data = json.loads(self.send_command("j/activeworkspace"))
+        self.__apply_active_workspace(self.__fetch_active_workspace())
+
+    def __fetch_active_workspace(self) -> tuple[str, dict] | None:
+        reply = self.send_command("j/activeworkspace")
+        if reply == self._active_workspace_reply:
+            return None
+
+        return reply, json.loads(reply)
+
+    def __apply_active_workspace(self, result: tuple[str, dict] | None) -> None:
+        if result is None:
+            return
+
+        self._active_workspace_reply, workspace_data = result
         self._active_workspace.sync(workspace_data)
         self.notify("active-workspace")
 
@@ -358,7 +526,20 @@ class HyprlandService(BaseService):
         self._main_keyboard.sync({"active_keymap": layout})
 
     def __sync_active_window(self) -> None:
-        active_window_data = json.loads(self.send_command("j/activewindow"))
+        self.__apply_active_window(self.__fetch_active_window())
+
+    def __fetch_active_window(self) -> tuple[str, dict] | None:
+        reply = self.send_command("j/activewindow")
+        if reply == self._active_window_reply:
+            return None
+
+        return reply, json.loads(reply)
+
+    def __apply_active_window(self, result: tuple[str, dict] | None) -> None:
+        if result is None:
+            return
+
+        self._active_window_reply, active_window_data = result
         if active_window_data == {}:
             active_window_data = HyprlandWindow().data
 
@@ -396,11 +577,21 @@ class HyprlandService(BaseService):
         )
 
     def __toggle_window_group(self, state: int, addresses: list[str]) -> None:
-        # To be honest, I can't understand at all how these window groups work
-        # For some reason IPC always sends only one window address
-        # even if there are several windows in a group (I add them there with the mouse, maybe that's the problem...)
-        for addr in addresses:
-            self.__sync_obj_data("window", addr, self.__get_obj_data("window", addr))
+        # fetch all windows once and look them up by address,
+        # instead of fetching them again for each window in the group
+        obj_desc = self._OBJ_TYPES["window"]
+
+        def fetch() -> dict[str, dict]:
+            return {
+                obj_desc.get_key_func(data): data
+                for data in json.loads(self.send_command(obj_desc.cmd))
+            }
+
+        def apply(data_by_address: dict[str, dict]) -> None:
+            for addr in addresses:
+                self.__sync_obj_data("window", addr, data_by_address.get(addr, {}))
+
+        self.__fetch_then_apply(fetch, apply)
 
     def __add_monitor(self, monitor_name: str) -> None:
         self.__add_obj(type_="monitor", key=monitor_name)
@@ -453,12 +644,14 @@ class HyprlandService(BaseService):
         Raises:
             HyprlandIPCNotFoundError: If Hyprland IPC is not found.
         """
-        if not self.is_available:
-            raise HyprlandIPCNotFoundError()
-
-        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
-            sock.connect(f"{HYPR_SOCKET_DIR}/.socket.sock")
-            return utils.send_socket(sock, cmd, errors="ignore")
+        # Hyprland closes the connection after each reply, so it can't be reused,
+        # but a missing socket is detected by connect() without an extra stat() per command
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(_IPC_SOCKET_PATH)
+                return utils.send_socket(sock, cmd, errors="ignore")
+        except FileNotFoundError:
+            raise HyprlandIPCNotFoundError() from None
 
     def switch_to_workspace(self, workspace_id: int) -> None:
         """
@@ -1,13 +1,46 @@
 import os
+import time
 import asyncio
 from ignis.dbus import DBusProxy
 from gi.repository import GLib  # type: ignore
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from ignis import utils
 from ignis.connection_manager import ConnectionManager
+from typing import Any
 from collections.abc import Callable
 from .constants import ART_URL_CACHE_DIR
-from .util import uri_to_unix_path
+from .util import uri_to_unix_path, download_to_path_async
+
+
+def _property_names(*py_names: str) -> tuple[tuple[str, str, str], ...]:
+    # (D-Bus name, private attribute name, GObject property name), computed once
+    return tuple(
+        (utils.snake_to_pascal(py_name), f"_{py_name}", py_name.replace("_", "-"))
+        for py_name in py_names
+    )
+
+
+# properties synced by MprisPlayer.__sync_all, by interface
+_PLAYER_PROPERTIES = _property_names(
+    "can_control",
+    "can_go_next",
+    "can_go_previous",
+    "can_pause",
+    "can_play",
+    "can_seek",
+    "loop_status",
+    "metadata",
+    "playback_status",
+    "shuffle",
+    "volume",
+)
+_MPRIS_PROPERTIES = _property_names(
+    "identity",
+    "desktop_entry",
+)
+
+# while playing, position is advanced locally and re-read from the player only this often (seconds)
+_POSITION_RESYNC_INTERVAL = 5
 
 
 class MprisPlayer(IgnisGObject):
@@ -47,6 +80,12 @@ class MprisPlayer(IgnisGObject):
         self._url: str | None = None
 
         self._previous_art_url: str | None = None
+        # raw metadata values the metadata-derived properties were last synced from
+        self._metadata_raw: dict[str, Any] = {}
+
+        # the last position read from the player and when it was read (time.monotonic())
+        self._position_ref: int = -1
+        self._position_ref_time: float = 0
 
         os.makedirs(ART_URL_CACHE_DIR, exist_ok=True)
 
@@ -62,6 +101,16 @@ class MprisPlayer(IgnisGObject):
             "notify::metadata",
             lambda *_: asyncio.create_task(self.__sync_metadata()),
         )
+        self._conn_mgr.connect(
+            self.__player_proxy.gproxy, "g-signal", self.__on_player_signal
+        )
+        # the local position estimate is only valid within one track and playback state
+        self._conn_mgr.connect(
+            self,
+            "notify::playback-status",
+            lambda *_: asyncio.create_task(self.__update_position()),
+        )
+        self._conn_mgr.connect(self, "notify::track-id", self.__on_track_changed)
 
     @classmethod
     async def new_async(cls, name: str) -> "MprisPlayer":
@@ -95,51 +144,49 @@ class MprisPlayer(IgnisGObject):
         self._sync_pos_task.cancel()
         self.emit("closed")
 
-    async def __sync_property(self, proxy: DBusProxy, py_name: str) -> None:
+    async def __sync_properties(
+        self, proxy: DBusProxy, names: tuple[tuple[str, str, str], ...]
+    ) -> None:
+        # a single GetAll instead of a Get for each property
         try:
-            value = await proxy.get_dbus_property_async(utils.snake_to_pascal(py_name))
+            values = await proxy.get_all_dbus_properties_async()
         except GLib.Error:
             return
 
-        if value == getattr(self, f"_{py_name}"):
-            return
+        for dbus_name, private_name, prop_name in names:
+            if dbus_name not in values:
+                continue
 
-        setattr(self, f"_{py_name}", value)
-        self.notify(py_name.replace("_", "-"))
+            value = values[dbus_name]
+            if value == getattr(self, private_name):
+                continue
+
+            setattr(self, private_name, value)
+            self.notify(prop_name)
 
     async def __sync_all(self) -> None:
-        for prop_name in (
-            "can_control",
-            "can_go_next",
-            "can_go_previous",
-            "can_pause",
-            "can_play",
-            "can_seek",
-            "loop_status",
-            "metadata",
-            "playback_status",
-            "shuffle",
-            "volume",
-        ):
-            await self.__sync_property(self.__player_proxy, prop_name)
-
-        for prop_name in (
-            "identity",
-            "desktop_entry",
-        ):
-            await self.__sync_property(self.__mpris_proxy, prop_name)
+        await asyncio.gather(
+            self.__sync_properties(self.__player_proxy, _PLAYER_PROPERTIES),
+            self.__sync_properties(self.__mpris_proxy, _MPRIS_PROPERTIES),
+        )
 
     def __sync_metadata_property(
         self, key: str, py_name: str, custom_func: Callable | None = None
     ) -> None:
         prop = self.metadata.get(key, None)
+
+        # compare raw values, converted ones (e.g., joined artist list) never equal them
+        previous = self._metadata_raw.get(key, None)
+        if prop is previous or prop == previous:
+            return
+
+        self._metadata_raw[key] = prop
         private_name = f"_{py_name}"
-        if prop != getattr(self, private_name):
-            if custom_func:
-                setattr(self, private_name, custom_func(prop))
-            else:
-                setattr(self, private_name, prop)
-            self.notify(py_name.replace("_", "-"))
+        if custom_func:
+            setattr(self, private_name, custom_func(prop))
+        else:
+            setattr(self, private_name, prop)
+        self.notify(py_name.replace("_", "-"))
 
     async def __sync_metadata(self) -> None:
         # sync all properties that depend on metadata
@@ -176,26 +223,54 @@ class MprisPlayer(IgnisGObject):
 
     async def __load_art_url(self, art_url: str) -> str:
         path = ART_URL_CACHE_DIR + "/" + uri_to_unix_path(art_url)
-        if os.path.exists(path):
-            return path
+        # the file may have been deleted meanwhile (e.g., the cache directory was cleaned)
+        if not os.path.exists(path):
+            await download_to_path_async(uri=art_url, path=path)
 
-        contents = await utils.read_file_async(uri=art_url, decode=False)
-        await utils.write_file_async(path=path, contents=contents)
         return path
 
+    def __on_player_signal(
+        self, proxy, sender_name: str, signal_name: str, parameters: GLib.Variant
+    ) -> None:
+        if signal_name == "Seeked":
+            self.__set_position(parameters[0])
+
+    def __set_position(self, position: int) -> None:
+        self._position_ref = position // 1_000_000
+        self._position_ref_time = time.monotonic()
+
+        if self._position_ref != self._position:
+            self._position = self._position_ref
+            self.notify("position")
+
     async def __update_position(self) -> None:
         try:
             position = await self.__player_proxy.get_dbus_property_async("Position")
         except GLib.Error:
             return
-        if position:
-            self._position = position // 1_000_000
-            self.notify("position")
+        # 0 is a valid position (e.g., right after a track change)
+        if position is not None:
+            self.__set_position(position)
+
+    def __on_track_changed(self, *args) -> None:
+        # drop the estimate of the previous track, so the next tick resyncs even if reading fails now
+        self._position_ref = -1
+        self._position_ref_time = 0
+        asyncio.create_task(self.__update_position())
 
     async def __sync_position(self) -> None:
+        # position advances by itself while playing, so compute it locally,
+        # jumps are reported by the Seeked signal and state changes trigger a resync
         while True:
-            if self.playback_status != "Paused":
-                await self.__update_position()
+            if self.playback_status == "Playing":
+                elapsed = time.monotonic() - self._position_ref_time
+                if elapsed >= _POSITION_RESYNC_INTERVAL:
+                    await self.__update_position()
+                else:
+                    position = self._position_ref + int(elapsed)
+                    if position != self._position:
+                        self._position = position
+                        self.notify("position")
             await asyncio.sleep(1)
 
     @IgnisSignal
@@ -1,7 +1,11 @@
 import os
+import functools
+from gi.repository import Gio, GLib  # type: ignore
 from urllib.parse import urlparse, unquote
 
 
+# art URLs repeat across tracks and players, the mapping is pure so it's safe to cache
+@functools.lru_cache(maxsize=256)
 def uri_to_unix_path(uri: str) -> str:
     parsed = urlparse(uri)
 
@@ -13,3 +17,27 @@ def uri_to_unix_path(uri: str) -> str:
 
     else:
         raise ValueError(f"Unsupported URI scheme: {parsed.scheme}")
+
+
+async def download_to_path_async(uri: str, path: str) -> None:
+    # stream the data from the source to the file,
+    # without holding the whole contents in memory
+    source = await Gio.File.new_for_uri(uri).read_async(GLib.PRIORITY_DEFAULT)  # type: ignore
+    target = await Gio.File.new_for_path(path).replace_async(  # type: ignore
+        None, False, Gio.FileCreateFlags.REPLACE_DESTINATION, GLib.PRIORITY_DEFAULT
+    )
+    try:
+        await target.splice_async(  # type: ignore
+            source, Gio.OutputStreamSpliceFlags.CLOSE_SOURCE, GLib.PRIORITY_DEFAULT
+        )
+    except BaseException:
+        # closing a replace stream commits it, a cancelled close discards the partial file instead
+        cancellable = Gio.Cancellable()
+        cancellable.cancel()
+        try:
+            target.close(cancellable)
+        except GLib.Error:
+            pass
+        raise
+
+    await target.close_async(GLib.PRIORITY_DEFAULT)  # type: ignore
@@ -1,3 +1,4 @@
+import functools
 from gi.repository import GLib  # type: ignore
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from typing import Literal
@@ -9,6 +10,41 @@ from .constants import WIFI_ICON_TEMPLATE
 
 window_manager = WindowManager.get_default()
 
+# the attribute name starts with a digit, so it can only be accessed via getattr
+_AP_SECURITY_NONE = getattr(NM, "80211ApSecurityFlags").NONE
+
+
+def _get_strength_icon_name(strength: int) -> str:
+    if strength > 80:
+        return WIFI_ICON_TEMPLATE.format("excellent")
+    elif strength > 60:
+        return WIFI_ICON_TEMPLATE.format("good")
+    elif strength > 40:
+        return WIFI_ICON_TEMPLATE.format("ok")
+    elif strength > 20:
+        return WIFI_ICON_TEMPLATE.format("weak")
+    elif strength > 0:
+        return WIFI_ICON_TEMPLATE.format("none")
+    else:
+        return "network-wireless-offline-symbolic"
+
+
+# icon_name is read on every strength change, so look the icon up instead of formatting it
+_STRENGTH_ICON_NAMES = tuple(_get_strength_icon_name(i) for i in range(101))
+
+
+@functools.lru_cache(maxsize=256)
+def _decode_ssid(data: bytes) -> str | None:
+    # almost every SSID is valid UTF-8, which NM would return unchanged anyway;
+    # anything else (including embedded NULs) goes through NM's locale fallbacks
+    if b"\0" not in data:
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+    return NM.utils_ssid_to_utf8(data)
+
 
 class WifiAccessPoint(IgnisGObject):
     """
@@ -33,17 +69,21 @@ class WifiAccessPoint(IgnisGObject):
             "notify::activating-connection", lambda *args: self.notify("icon-name")
         )
 
-        self._client.connect(
-            "notify::connections", lambda *_: self.__sync_connections()
-        )
-
         self._setup()
 
     def __sync_connections(self) -> None:
-        self._connections = filter_connections(
-            self._point,
-            filter_connections(self._device, self._client.get_connections()),  # type: ignore
+        self._sync_device_connections(
+            filter_connections(self._device, self._client.get_connections())  # type: ignore
         )
+
+    def _sync_device_connections(
+        self, device_connections: list[NM.RemoteConnection]
+    ) -> None:
+        """
+        :meta private:
+        """
+        # WifiDevice filters the client's connections by device once for all its access points
+        self._connections = filter_connections(self._point, device_connections)  # type: ignore
         self.notify("psk")
 
     def _setup(self) -> None:
@@ -67,7 +107,7 @@ class WifiAccessPoint(IgnisGObject):
         if not data:
             return None
 
-        return NM.utils_ssid_to_utf8(data)
+        return _decode_ssid(bytes(data))
 
     @IgnisSignal
     def removed(self):
@@ -141,28 +181,16 @@ class WifiAccessPoint(IgnisGObject):
             if ac.get_state() == NM.ActiveConnectionState.ACTIVATING:
                 return "network-wireless-acquiring-symbolic"
 
-        if self.strength > 80:
-            return WIFI_ICON_TEMPLATE.format("excellent")
-        elif self.strength > 60:
-            return WIFI_ICON_TEMPLATE.format("good")
-        elif self.strength > 40:
-            return WIFI_ICON_TEMPLATE.format("ok")
-        elif self.strength > 20:
-            return WIFI_ICON_TEMPLATE.format("weak")
-        elif self.strength > 0:
-            return WIFI_ICON_TEMPLATE.format("none")
-        else:
-            return "network-wireless-offline-symbolic"
+        return _STRENGTH_ICON_NAMES[min(self._point.props.strength, 100)]
 
     @IgnisProperty
     def security(self) -> Literal["WPA1", "WPA2/WPA3"] | None:
         """
         The security protocol of the access point (``WPA1``, ``WPA2/WPA3``).
         """
-        NM_80211ApSecurityFlags = getattr(NM, "80211ApSecurityFlags")
-        if self._point.props.wpa_flags != NM_80211ApSecurityFlags.NONE:
+        if self._point.props.wpa_flags != _AP_SECURITY_NONE:
             return "WPA1"
-        elif self._point.props.rsn_flags != NM_80211ApSecurityFlags.NONE:
+        elif self._point.props.rsn_flags != _AP_SECURITY_NONE:
             return "WPA2/WPA3"
         else:
             return None
@@ -20,9 +20,6 @@ class VpnConnection(IgnisGObject):
         ]
         self._is_connected: bool = connection.get_uuid() in active_uuids
 
-        self._client.connect("notify::active-connections", self.__update_is_connected)
-        self.__update_is_connected()
-
     @IgnisSignal
     def removed(self):
         """
@@ -74,13 +71,15 @@ class VpnConnection(IgnisGObject):
                     conn,
                 )
 
-    def __update_is_connected(self, *args) -> None:
-        active_uuids = [
-            conn.get_uuid() for conn in self._client.get_active_connections()
-        ]
-        self._is_connected = self._connection.get_uuid() in active_uuids
+    def _update_is_connected(self, active_uuids: set[str]) -> None:
+        # called by Vpn, which computes the set of active UUIDs once for all connections
+        is_connected = self._connection.get_uuid() in active_uuids
 
-        self.notify("is-connected")
+        # NM notifies active-connections for every connection of any type,
+        # don't make listeners (e.g., Vpn) resync when this VPN didn't change
+        if is_connected != self._is_connected:
+            self._is_connected = is_connected
+            self.notify("is-connected")
 
 
 class Vpn(IgnisGObject):
@@ -100,6 +99,9 @@ class Vpn(IgnisGObject):
         )
         self._client.connect("connection-added", self.__add_connection)
         self._client.connect("connection-removed", self.__remove_connection)
+        self._client.connect(
+            "notify::active-connections", self.__update_connections_state
+        )
 
         for i in self._client.get_connections():
             self.__add_connection(None, i, False)
@@ -166,6 +168,21 @@ class Vpn(IgnisGObject):
         else:
             return "network-vpn-disconnected-symbolic"
 
+    def __update_connections_state(self, *args) -> None:
+        # active-connections changes for every connection type, most setups have no VPNs at all
+        if not self._connections and not self._active_connections:
+            return
+
+        active_uuids = {
+            conn.get_uuid() for conn in self._client.get_active_connections()
+        }
+
+        for obj in self._connections.values():
+            obj._update_is_connected(active_uuids)
+
+        for obj in self._active_connections.values():
+            obj._update_is_connected(active_uuids)
+
     @check_is_vpn
     def __add_connection(
         self, client, connection: NM.Connection, emit: bool = True
@@ -1,5 +1,7 @@
+from gi.repository import GLib  # type: ignore
 from ignis.gobject import IgnisGObject, IgnisProperty, IgnisSignal
 from ._imports import NM
+from .util import filter_connections
 from .access_point import WifiAccessPoint, ActiveAccessPoint
 from .constants import STATE
 
@@ -14,6 +16,7 @@ class WifiDevice(IgnisGObject):
         self._device = device
         self._client = client
         self._access_points: dict[str, WifiAccessPoint] = {}  # bssid: WifiAccessPoint
+        self._connections_sync_pending = False
 
         self._client.connect(
             "notify::wireless-enabled", lambda *args: self.notify_all()
@@ -21,6 +24,10 @@ class WifiDevice(IgnisGObject):
 
         self._ap: ActiveAccessPoint = ActiveAccessPoint(self._device, self._client)
 
+        self._client.connect(
+            "notify::connections", lambda *args: self.__schedule_connections_sync()
+        )
+
         self._device.connect("access-point-added", self.__add_access_point)
         self._device.connect("access-point-removed", self.__remove_access_point)
 
@@ -85,6 +92,27 @@ class WifiDevice(IgnisGObject):
 
         await self._device.request_scan_async()  # type: ignore
 
+    def __schedule_connections_sync(self) -> None:
+        # NM notifies connections once per added/removed connection, sync once per burst
+        if not self._connections_sync_pending:
+            self._connections_sync_pending = True
+            GLib.idle_add(self.__sync_connections)
+
+    def __sync_connections(self) -> bool:
+        self._connections_sync_pending = False
+
+        # filter by device once instead of in every access point
+        device_connections = filter_connections(
+            self._device,
+            self._client.get_connections(),  # type: ignore
+        )
+
+        self._ap._sync_device_connections(device_connections)
+        for obj in self._access_points.values():
+            obj._sync_device_connections(device_connections)
+
+        return GLib.SOURCE_REMOVE
+
     def __add_access_point(
         self, device, access_point: NM.AccessPoint, emit: bool = True
     ) -> None:
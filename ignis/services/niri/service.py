@@ -1,6 +1,7 @@
 import json
 import os
 import socket
+from gi.repository import GLib  # type: ignore
 from ignis import utils
 from ignis.exceptions import NiriIPCNotFoundError
 from ignis.base_service import BaseService
@@ -47,6 +48,10 @@ class NiriService(BaseService):
         self._active_output: str = ""
         self._overview_opened = False
 
+        self._events_socket: socket.socket | None = None
+        self._events_buffer = b""
+        self._events_source_id: int | None = None
+
         if self.is_available:
             self.__start_event_stream()
 
@@ -124,16 +129,30 @@ class NiriService(BaseService):
         sock.connect(str(NIRI_SOCKET))
         sock.send(b'"EventStream"\n')
 
+        self._events_socket = sock
+
         # Close socket gracefully on app quit
-        IgnisApp.get_initialized().connect("shutdown", lambda *_: sock.close())
+        IgnisApp.get_initialized().connect(
+            "shutdown", lambda *_: self.__stop_event_stream()
+        )
 
-        # Launch an unthreaded event stream to ensure all variables get initialized
+        # Read the event stream blocking at first to ensure all variables get initialized
         # before returning from __init__ . OverviewOpenedOrClosed is the last
         # event to be sent during initialization of the Niri event stream, so once
-        # it is received, we are ready to launch a threaded (non blocking) version.
-        self.__listen_events(sock=sock, break_on="OverviewOpenedOrClosed")
-
-        utils.thread(lambda: self.__listen_events(sock=sock))
+        # it is received, we are ready to watch the socket from the main loop (non blocking).
+        while not self.__read_events(break_on="OverviewOpenedOrClosed"):
+            pass
+
+        if self._events_socket is None:
+            return
+
+        sock.setblocking(False)
+        self._events_source_id = GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT,
+            sock.fileno(),
+            GLib.IOCondition.IN | GLib.IOCondition.HUP | GLib.IOCondition.ERR,
+            self.__on_events_ready,
+        )
         # No need to send any other commands after event stream initialization:
         #
         #  "The event stream IPC is designed to give you the complete current
@@ -142,17 +161,61 @@ class NiriService(BaseService):
         #  any other IPC information requests."
         #   - https://github.com/YaLTeR/niri/wiki/IPC
 
-    def __listen_events(self, sock: socket.socket, break_on: str = "") -> None:
-        for event in utils.listen_socket(sock, errors="ignore"):
-            json_data = json.loads(event)
-            event_type = list(json_data.keys())[0]
-            event_data = list(json_data.values())[0]
+    def __stop_event_stream(self) -> None:
+        if self._events_source_id is not None:
+            GLib.source_remove(self._events_source_id)
+            self._events_source_id = None
+
+        if self._events_socket is not None:
+            self._events_socket.close()
+            self._events_socket = None
+
+    def __on_events_ready(self, fd: int, condition: GLib.IOCondition) -> bool:
+        # drain everything available, events come in bursts (e.g., on workspace switch)
+        while not self.__read_events():
+            pass
+
+        if self._events_socket is None:
+            self._events_source_id = None
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+    def __read_events(self, break_on: str = "") -> bool:
+        # returns True if reading should stop: the socket has no more data,
+        # it was closed, or the break_on event was received
+        sock = self._events_socket
+        if sock is None:
+            return True
+
+        try:
+            data = sock.recv(65536)
+        except BlockingIOError:
+            return True
+        except OSError:
+            data = b""
+
+        if not data:
+            self.__stop_event_stream()
+            return True
+
+        # handle all complete events at once, keep the incomplete tail for the next read
+        *events, self._events_buffer = (self._events_buffer + data).split(b"\n")
+
+        received_break_on = False
+        for event in events:
+            # each event is an object with a single key: the event type
+            event_type, event_data = next(
+                iter(json.loads(event.decode("utf-8", errors="ignore")).items())
+            )
 
             self.__on_event_received(event_type, event_data)
             if break_on and break_on == event_type:
-                return
+                received_break_on = True
 
-    def __on_event_received(self, event_type: dict, event_data: dict) -> None:
+        return received_break_on
+
+    def __on_event_received(self, event_type: str, event_data: dict) -> None:
         match event_type:
             case "KeyboardLayoutSwitched":
                 self.__update_current_layout(event_data)
@@ -247,16 +310,9 @@ class NiriService(BaseService):
             niri_obj[fresh_item["id"]] = obj
 
     def __cleanup_niri_obj(self, niri_obj: dict, fresh_data: list) -> None:
-        for id_, item in niri_obj.copy().items():
-            still_exists = False
-            for fresh_item in fresh_data:
-                if fresh_item["id"] == id_:
-                    still_exists = True
-                    break
-
-            if not still_exists:
-                niri_obj.pop(id_)
-                item.emit("destroyed")
+        fresh_ids = {fresh_item["id"] for fresh_item in fresh_data}
+        for id_ in niri_obj.keys() - fresh_ids:
+            niri_obj.pop(id_).emit("destroyed")
 
     def __update_windows(self, data: dict) -> None:
         windows = data["windows"]
@@ -304,10 +360,8 @@ class NiriService(BaseService):
 
         self.__sort_workspaces()
 
-        self._active_output = [w for w in self._workspaces.values() if w.is_focused][
-            0
-        ].output
-        self.notify("active-output")
+        focused = next(w for w in self._workspaces.values() if w.is_focused)
+        self.__set_active_output(focused.output)
         self.notify("workspaces")
 
     def __update_active_workspace(self, data: dict) -> None:
@@ -327,14 +381,22 @@ class NiriService(BaseService):
             if is_focused:
                 data["is_focused"] = got_activated
 
-            workspace.sync(data)
+            # nothing changes for workspaces on other outputs if focus stayed,
+            # syncing an empty dict would still notify "data" and drop latest_synced_data
+            if data:
+                workspace.sync(data)
 
         if is_focused:
-            self._active_output = output
+            self.__set_active_output(output)
 
-        self.notify("active-output")
         self.notify("workspaces")
 
+    def __set_active_output(self, output: str) -> None:
+        # switching workspaces on the same output is the common case, don't notify for it
+        if output != self._active_output:
+            self._active_output = output
+            self.notify("active-output")
+
     def __update_workspace_active_window(self, data: dict) -> None:
         self._workspaces[data["workspace_id"]].sync(
             {"active_window_id": data["active_window_id"]}
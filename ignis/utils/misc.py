@@ -1,5 +1,6 @@
 import os
 import inspect
+import functools
 from gi.repository import Gio, Gdk, Gtk  # type: ignore
 from ignis.exceptions import DisplayNotFoundError
 
@@ -16,11 +17,19 @@ def get_current_dir() -> str:
 DBUS_DIR = get_current_dir() + "/../dbus"
 
 
+@functools.cache
+def _load_builtin_interface_xml(interface_name: str) -> Gio.DBusInterfaceInfo:
+    # built-in interfaces are static, parse each of them only once
+    with open(f"{DBUS_DIR}/{interface_name}.xml") as file:
+        return Gio.DBusNodeInfo.new_for_xml(file.read()).interfaces[0]
+
+
 def load_interface_xml(
     interface_name: str | None = None, path: str | None = None, xml: str | None = None
 ) -> Gio.DBusInterfaceInfo:
     """
     Load interface info from XML.
+    Interfaces loaded by ``interface_name`` are parsed once and cached.
     If you want to load interface info from the path or XML string, you need to provide ``path`` and ``xml`` as keyword arguments respectively.
 
     Args:
@@ -37,9 +46,7 @@ def load_interface_xml(
     xml_string: str
 
     if interface_name:
-        file_path = f"{DBUS_DIR}/{interface_name}.xml"
-        with open(file_path) as file:
-            xml_string = file.read()
+        return _load_builtin_interface_xml(interface_name)
     elif path:
         with open(path) as file:
             xml_string = file.read()
@@ -53,20 +60,30 @@ def load_interface_xml(
     return Gio.DBusNodeInfo.new_for_xml(xml_string).interfaces[0]
 
 
+_display: Gdk.Display | None = None
+
+
 def get_gdk_display() -> Gdk.Display:
     """
     Get the default :class:`Gdk.Display` or raise :class:`DisplayNotFoundError` if it's ``None``.
 
+    The display is looked up once and then cached, GTK uses a single display for the whole application lifetime.
+
     Returns:
         The default :class:`Gdk.Display`.
 
     Raises:
         DisplayNotFoundError: If :func:`Gdk.Display.get_default` returned ``None``.
     """
-    if display := Gdk.Display.get_default():
-        return display
-    else:
-        raise DisplayNotFoundError()
+    global _display
+
+    if _display is None:
+        _display = Gdk.Display.get_default()
+
+        if _display is None:
+            raise DisplayNotFoundError()
+
+    return _display
 
 
 def open_inspector() -> None:
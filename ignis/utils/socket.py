@@ -21,22 +21,33 @@ def send_socket(
     Returns:
         The response from the socket.
     """
-    sock.send(message.encode())
+    sock.sendall(message.encode())
 
-    resp = bytearray()
     end_bytes = end_char.encode() if end_char is not None else None
 
+    # receive straight into one buffer that doubles when full,
+    # instead of allocating a new bytes object for every chunk
+    buf = bytearray(8192)
+    view = memoryview(buf)
+    size = 0
+
     while True:
-        chunk = sock.recv(8192)
-        if not chunk:
+        n = sock.recv_into(view[size:])
+        if not n:
             break
 
-        resp.extend(chunk)
+        size += n
 
-        if end_bytes and resp.endswith(end_bytes):
+        if end_bytes and buf.endswith(end_bytes, 0, size):
             break
 
-    return resp.decode("utf-8", errors=errors)
+        if size == len(buf):
+            view.release()
+            buf.extend(bytes(len(buf)))
+            view = memoryview(buf)
+
+    view.release()
+    return buf[:size].decode("utf-8", errors=errors)
 
 
 def listen_socket(
@@ -66,10 +77,10 @@ def listen_socket(
 
     buffer = b""
     while True:
-        new_data = sock.recv(8192)
+        new_data = sock.recv(65536)
         if not new_data:
             break
-        buffer += new_data
-        while b"\n" in buffer:
-            data, buffer = buffer.split(b"\n", 1)
+        # split all complete messages at once, keep the incomplete tail for the next read
+        *messages, buffer = (buffer + new_data).split(b"\n")
+        for data in messages:
             yield data.decode("utf-8", errors=errors)